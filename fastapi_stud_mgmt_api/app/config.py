@@ -9,6 +9,14 @@ class Settings(BaseSettings):
     jwt_secret_key: str = os.getenv("JWT_SECRET_KEY", "your-super-secret-jwt-key-here-change-this-in-production")
     jwt_algorithm: str = os.getenv("JWT_ALGORITHM", "HS256")
     access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    refresh_token_expire_days: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+    refresh_token_reuse_grace_seconds: int = int(os.getenv("REFRESH_TOKEN_REUSE_GRACE_SECONDS", "10"))
+    query_profiling: bool = os.getenv("QUERY_PROFILING", "false").lower() == "true"
+    slow_query_ms: float = float(os.getenv("SLOW_QUERY_MS", "100"))
+    explain_sample_rate: float = float(os.getenv("EXPLAIN_SAMPLE_RATE", "0.01"))
+    admin_usernames: str = os.getenv("ADMIN_USERNAMES", "")
+    admission_control: bool = os.getenv("ADMISSION_CONTROL", "true").lower() == "true"
+    admission_queue_deadline_ms: float = float(os.getenv("ADMISSION_QUEUE_DEADLINE_MS", "1000"))
 
     class Config:
         env_file = ".env"
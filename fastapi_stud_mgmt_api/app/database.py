@@ -1,10 +1,12 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.config import settings
+from app.utils.profiler import QueryProfiler, ProfiledDatabase
 
 
 class Database:
     client: AsyncIOMotorClient = None
     database = None
+    profiler: QueryProfiler = None
 
 
 db = Database()
@@ -18,7 +20,26 @@ async def connect_to_mongo():
     """Create database connection"""
     db.client = AsyncIOMotorClient(settings.mongodb_uri)
     db.database = db.client[settings.database_name]
+    if settings.query_profiling:
+        db.profiler = QueryProfiler(
+            slow_query_ms=settings.slow_query_ms,
+            explain_sample_rate=settings.explain_sample_rate
+        )
+        db.database = ProfiledDatabase(db.database, db.profiler)
+        print(f"Query profiling enabled (slow query threshold {settings.slow_query_ms} ms)")
     print(f"Connected to MongoDB at {settings.mongodb_uri}")
+    await create_indexes()
+
+
+async def create_indexes():
+    """Create indexes required by the application"""
+    # Users are looked up by username on every authenticated request and refresh
+    await db.database.users.create_index("username")
+
+    # Refresh token sessions: lookups by hash, family revocation, TTL expiry
+    await db.database.sessions.create_index("token_hash", unique=True)
+    await db.database.sessions.create_index("family_id")
+    await db.database.sessions.create_index("expires_at", expireAfterSeconds=0)
 
 
 async def close_mongo_connection():
@@ -1,7 +1,11 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.routing import Match
+from app.config import settings
 from app.database import connect_to_mongo, close_mongo_connection
-from app.routes import auth, student
+from app.middleware.admission import AdaptiveLimiter, AdmissionControlMiddleware
+from app.routes import admin, auth, student
+from app.utils.profiler import current_route
 
 app = FastAPI(
     title="Student Management API",
@@ -9,6 +13,25 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Add admission control middleware (added before CORS so shed responses still get CORS headers)
+if settings.admission_control:
+    deadline_ms = settings.admission_queue_deadline_ms
+    app.state.admission_limiters = {
+        # Login and register block on bcrypt, so keep their concurrency low
+        "auth": AdaptiveLimiter("auth", initial_limit=4, min_limit=1, max_limit=16,
+                                target_latency_ms=500, queue_deadline_ms=deadline_ms, max_queue=32),
+        # Token refresh and logout only cost an indexed lookup
+        "session": AdaptiveLimiter("session", initial_limit=32, min_limit=4, max_limit=256,
+                                   target_latency_ms=200, queue_deadline_ms=deadline_ms, max_queue=256),
+        "student_read": AdaptiveLimiter("student_read", initial_limit=32, min_limit=4, max_limit=256,
+                                        target_latency_ms=200, queue_deadline_ms=deadline_ms, max_queue=256),
+        "student_write": AdaptiveLimiter("student_write", initial_limit=16, min_limit=2, max_limit=128,
+                                         target_latency_ms=300, queue_deadline_ms=deadline_ms, max_queue=128),
+        "export": AdaptiveLimiter("export", initial_limit=2, min_limit=1, max_limit=4,
+                                  target_latency_ms=5000, queue_deadline_ms=deadline_ms * 5, max_queue=8),
+    }
+    app.add_middleware(AdmissionControlMiddleware, limiters=app.state.admission_limiters)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -21,6 +44,27 @@ app.add_middleware(
 # Include routers with API versioning
 app.include_router(auth.router, prefix="/v1")
 app.include_router(student.router, prefix="/v1")
+app.include_router(admin.router, prefix="/v1")
+
+
+def route_template(request: Request) -> str:
+    """Resolve the path template of the route a request will be dispatched to"""
+    for route in app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+    return "<unmatched>"
+
+
+if settings.query_profiling:
+    @app.middleware("http")
+    async def track_route(request: Request, call_next):
+        """Tag database operations with the route that issued them"""
+        token = current_route.set(f"{request.method} {route_template(request)}")
+        try:
+            return await call_next(request)
+        finally:
+            current_route.reset(token)
 
 
 @app.on_event("startup")
@@ -0,0 +1,165 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+
+class AdaptiveLimiter:
+    """Concurrency limiter whose limit adapts to observed latency (AIMD).
+
+    Every request that finishes under the target latency raises the limit by
+    roughly one per window of requests; a request over the target cuts the
+    limit multiplicatively, at most once per target interval.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        target_latency_ms: float,
+        queue_deadline_ms: float,
+        max_queue: int,
+        backoff: float = 0.9
+    ):
+        self.name = name
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency_ms / 1000
+        self.queue_deadline = queue_deadline_ms / 1000
+        self.max_queue = max_queue
+        self.backoff = backoff
+        self.in_flight = 0
+        self.rejected = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+
+    async def acquire(self) -> bool:
+        """Wait for a slot until the queue deadline; returns False if shed"""
+        if self.in_flight < self.allowed() and not self._waiters:
+            self.in_flight += 1
+            return True
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await self._wait_for_slot(waiter)
+            return True
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just as the deadline expired
+                return True
+            waiter.cancel()
+            self.rejected += 1
+            return False
+        except asyncio.CancelledError:
+            # Client went away; hand back a slot we may have been given
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1
+                self._wake_waiters()
+            waiter.cancel()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    async def _wait_for_slot(self, waiter: asyncio.Future) -> None:
+        """Wait for a slot to be handed to `waiter`, up to the queue deadline"""
+        # Shielded so a timeout does not cancel a waiter that was just handed a slot
+        await asyncio.wait_for(asyncio.shield(waiter), self.queue_deadline)
+
+    def release(self, latency: float) -> None:
+        """Free a slot and adjust the limit from the request's latency"""
+        self.in_flight -= 1
+
+        now = time.monotonic()
+        if latency > self.target_latency:
+            if now - self._last_decrease >= self.target_latency:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+        self._wake_waiters()
+
+    def allowed(self) -> int:
+        """Number of concurrent requests currently admitted"""
+        # Round up so a small multiplicative cut does not drop a whole slot
+        return math.ceil(self.limit)
+
+    def retry_after(self) -> int:
+        """Seconds a shed client should wait before retrying"""
+        return max(1, math.ceil(self.queue_deadline))
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.allowed():
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "limit": round(self.limit, 2),
+            "allowed": self.allowed(),
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "rejected": self.rejected,
+        }
+
+
+def classify_request(request: Request) -> Optional[str]:
+    """Map a request to its route class, or None if it is not admission controlled"""
+    path = request.url.path
+    if path in ("/v1/auth/login", "/v1/auth/register"):
+        return "auth"
+    if path.startswith("/v1/auth"):
+        # Refresh and logout are a single indexed lookup; keep them apart from
+        # bcrypt-bound logins so they are not shed when logins saturate
+        return "session"
+    if path.startswith("/v1/students"):
+        if "/export" in path:
+            return "export"
+        if request.method == "GET" or path.endswith("/batch-get"):
+            return "student_read"
+        return "student_write"
+    return None
+
+
+class AdmissionControlMiddleware(BaseHTTPMiddleware):
+    """Sheds requests with a fast 503 when their route class cannot serve them in time"""
+
+    def __init__(self, app, limiters: Dict[str, AdaptiveLimiter]):
+        super().__init__(app)
+        self.limiters = limiters
+
+    async def dispatch(self, request: Request, call_next):
+        route_class = classify_request(request)
+        limiter = self.limiters.get(route_class)
+        if limiter is None:
+            return await call_next(request)
+
+        if not await limiter.acquire():
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "Server is overloaded, please retry later"},
+                headers={"Retry-After": str(limiter.retry_after())},
+            )
+
+        start = time.monotonic()
+        try:
+            return await call_next(request)
+        finally:
+            limiter.release(time.monotonic() - start)
@@ -3,6 +3,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.utils.jwt_handler import verify_token
 from app.services.auth import get_user_by_username
 from app.models.auth import User
+from app.config import settings
 
 security = HTTPBearer()
 
@@ -33,4 +34,17 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     """Get current active user"""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+def is_admin_user(user: User) -> bool:
+    """Check whether a user is flagged as admin or listed in ADMIN_USERNAMES"""
+    allowed = {name.strip() for name in settings.admin_usernames.split(",") if name.strip()}
+    return user.is_admin or user.username in allowed
+
+
+async def get_current_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
+    """Get current user, hiding the route from anyone who is not an admin"""
+    if not is_admin_user(current_user):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return current_user
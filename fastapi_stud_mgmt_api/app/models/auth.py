@@ -16,6 +16,11 @@ class UserLogin(BaseModel):
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
 
 
 class TokenData(BaseModel):
@@ -26,4 +31,5 @@ class User(BaseModel):
     id: Optional[str] = None
     username: str
     email: EmailStr
-    is_active: bool = True
\ No newline at end of file
+    is_active: bool = True
+    is_admin: bool = False
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional
+from typing import List, Literal, Optional
 
 
 class StudentBase(BaseModel):
@@ -28,4 +28,18 @@ class StudentResponse(StudentBase):
     id: str
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class StudentBatchGetRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=500)
+
+
+class StudentBatchGetItem(BaseModel):
+    id: str
+    status: Literal["found", "not_found", "invalid_id"]
+    student: Optional[StudentResponse] = None
+
+
+class StudentBatchGetResponse(BaseModel):
+    results: List[StudentBatchGetItem]
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from app.database import db
+from app.models.auth import User
+from app.middleware.auth import get_current_admin_user
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+def _get_profiler():
+    if db.profiler is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return db.profiler
+
+
+@router.get("/query-profile")
+async def get_query_profile(
+    limit: int = Query(20, ge=1, le=500),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Get the top query shapes by total time (admins only, requires QUERY_PROFILING=true)"""
+    profiler = _get_profiler()
+    return {
+        "slow_query_ms": profiler.slow_query_ms,
+        "explain_sample_rate": profiler.explain_sample_rate,
+        "shapes": profiler.top_shapes(limit)
+    }
+
+
+@router.delete("/query-profile", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_query_profile(current_user: User = Depends(get_current_admin_user)):
+    """Clear collected query profile statistics (admins only)"""
+    _get_profiler().reset()
+    return None
+
+
+@router.get("/admission")
+async def get_admission_stats(
+    request: Request,
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Get admission control limits, in-flight and shed counts per route class (admins only)"""
+    limiters = getattr(request.app.state, "admission_limiters", None)
+    if limiters is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return {name: limiter.stats() for name, limiter in limiters.items()}
@@ -1,6 +1,12 @@
 from fastapi import APIRouter, HTTPException, status
-from app.models.auth import UserCreate, UserLogin, Token, User
+from app.models.auth import UserCreate, UserLogin, Token, User, RefreshRequest
 from app.services.auth import create_user, authenticate_user
+from app.services.session import (
+    create_session,
+    rotate_refresh_token,
+    revoke_session,
+    RefreshTokenReuseError
+)
 from app.utils.jwt_handler import create_access_token
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -21,7 +27,7 @@ async def register(user: UserCreate):
 
 @router.post("/login", response_model=Token)
 async def login(user_credentials: UserLogin):
-    """Login user and return JWT token"""
+    """Login user and return JWT access and refresh tokens"""
     user = await authenticate_user(user_credentials.username, user_credentials.password)
     
     if not user:
@@ -32,5 +38,36 @@ async def login(user_credentials: UserLogin):
         )
     
     access_token = create_access_token(data={"sub": user.username})
+    refresh_token = await create_session(user.username)
     
-    return Token(access_token=access_token, token_type="bearer")
\ No newline at end of file
+    return Token(access_token=access_token, token_type="bearer", refresh_token=refresh_token)
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(refresh_request: RefreshRequest):
+    """Exchange a refresh token for a new access token and refresh token"""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
+    try:
+        rotated = await rotate_refresh_token(refresh_request.refresh_token)
+    except RefreshTokenReuseError:
+        raise credentials_exception
+    
+    if not rotated:
+        raise credentials_exception
+    
+    username, refresh_token = rotated
+    access_token = create_access_token(data={"sub": username})
+    
+    return Token(access_token=access_token, token_type="bearer", refresh_token=refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(refresh_request: RefreshRequest):
+    """Revoke the session belonging to a refresh token"""
+    await revoke_session(refresh_request.refresh_token)
+    return None
\ No newline at end of file
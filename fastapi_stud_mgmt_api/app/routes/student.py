@@ -1,13 +1,22 @@
 from typing import List
+from bson import ObjectId
 from fastapi import APIRouter, HTTPException, status, Depends
-from app.models.student import StudentCreate, StudentUpdate, StudentResponse
+from app.models.student import (
+    StudentCreate,
+    StudentUpdate,
+    StudentResponse,
+    StudentBatchGetRequest,
+    StudentBatchGetItem,
+    StudentBatchGetResponse
+)
 from app.models.auth import User
 from app.services.student import (
     create_student,
     get_student_by_id,
     get_all_students,
     update_student,
-    delete_student
+    delete_student,
+    StudentLoader
 )
 from app.middleware.auth import get_current_active_user
 
@@ -37,6 +46,28 @@ async def get_students(current_user: User = Depends(get_current_active_user)):
     return students
 
 
+@router.post("/batch-get", response_model=StudentBatchGetResponse)
+async def batch_get_students(
+    batch_request: StudentBatchGetRequest,
+    current_user: User = Depends(get_current_active_user),
+    loader: StudentLoader = Depends(StudentLoader)
+):
+    """Get several students by ID in one round trip, in request order"""
+    valid_ids = [i for i in batch_request.ids if ObjectId.is_valid(i)]
+    found = dict(zip(valid_ids, await loader.load_many(valid_ids)))
+    
+    results = []
+    for student_id in batch_request.ids:
+        if student_id not in found:
+            results.append(StudentBatchGetItem(id=student_id, status="invalid_id"))
+        elif found[student_id] is None:
+            results.append(StudentBatchGetItem(id=student_id, status="not_found"))
+        else:
+            results.append(StudentBatchGetItem(id=student_id, status="found", student=found[student_id]))
+    
+    return StudentBatchGetResponse(results=results)
+
+
 @router.get("/{student_id}", response_model=StudentResponse)
 async def get_student(
     student_id: str,
@@ -0,0 +1,14 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class SessionInDB(BaseModel):
+    token_hash: str
+    family_id: str
+    username: str
+    created_at: datetime
+    expires_at: datetime
+    revoked: bool = False
+    replaced_by: Optional[str] = None
+    rotated_at: Optional[datetime] = None
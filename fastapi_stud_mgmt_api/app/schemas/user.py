@@ -6,4 +6,5 @@ class UserInDB(BaseModel):
     username: str
     email: EmailStr
     hashed_password: str
-    is_active: bool = True
\ No newline at end of file
+    is_active: bool = True
+    is_admin: bool = False
\ No newline at end of file
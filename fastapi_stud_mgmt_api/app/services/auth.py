@@ -4,6 +4,7 @@ from app.models.auth import User, UserCreate
 from app.schemas.user import UserInDB
 from app.utils.password import hash_password, verify_password
 from bson import ObjectId
+from starlette.concurrency import run_in_threadpool
 
 
 async def create_user(user: UserCreate) -> User:
@@ -19,13 +20,14 @@ async def create_user(user: UserCreate) -> User:
     if existing_email:
         raise ValueError("Email already exists")
     
-    # Hash password and create user
-    hashed_password = hash_password(user.password)
+    # Hash password off the event loop so bcrypt does not stall other requests
+    hashed_password = await run_in_threadpool(hash_password, user.password)
     user_data = {
         "username": user.username,
         "email": user.email,
         "hashed_password": hashed_password,
-        "is_active": True
+        "is_active": True,
+        "is_admin": False
     }
     
     result = await db.users.insert_one(user_data)
@@ -46,14 +48,15 @@ async def authenticate_user(username: str, password: str) -> Optional[User]:
     if not user_data:
         return None
     
-    if not verify_password(password, user_data["hashed_password"]):
+    if not await run_in_threadpool(verify_password, password, user_data["hashed_password"]):
         return None
     
     return User(
         id=str(user_data["_id"]),
         username=user_data["username"],
         email=user_data["email"],
-        is_active=user_data["is_active"]
+        is_active=user_data["is_active"],
+        is_admin=user_data.get("is_admin", False)
     )
 
 
@@ -69,5 +72,6 @@ async def get_user_by_username(username: str) -> Optional[User]:
         id=str(user_data["_id"]),
         username=user_data["username"],
         email=user_data["email"],
-        is_active=user_data["is_active"]
-        )
\ No newline at end of file
+        is_active=user_data["is_active"],
+        is_admin=user_data.get("is_admin", False)
+    )
\ No newline at end of file
@@ -0,0 +1,108 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from app.config import settings
+from app.database import get_database
+from app.services.auth import get_user_by_username
+from app.schemas.session import SessionInDB
+
+
+class RefreshTokenReuseError(ValueError):
+    """Raised when an already rotated refresh token is presented again"""
+
+
+def hash_refresh_token(token: str) -> str:
+    """Hash a refresh token for storage (SHA-256, tokens are high entropy)"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _new_refresh_token() -> Tuple[str, str]:
+    """Generate a refresh token, returning (token, token_hash)"""
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
+
+
+async def _store_session(token_hash: str, username: str, family_id: str, expires_at: datetime) -> None:
+    """Persist a refresh token session"""
+    db = await get_database()
+    session = SessionInDB(
+        token_hash=token_hash,
+        family_id=family_id,
+        username=username,
+        created_at=datetime.utcnow(),
+        expires_at=expires_at,
+    )
+    await db.sessions.insert_one(session.model_dump())
+
+
+async def create_session(username: str) -> str:
+    """Start a new session for a user and return its refresh token"""
+    token, token_hash = _new_refresh_token()
+    expires_at = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
+    await _store_session(token_hash, username, secrets.token_hex(16), expires_at)
+    return token
+
+
+async def rotate_refresh_token(token: str) -> Optional[Tuple[str, str]]:
+    """Exchange a refresh token for a new one.
+
+    Returns (username, new_refresh_token), or None if the token is unknown
+    or expired, or its user no longer exists or is inactive. Raises
+    RefreshTokenReuseError if the token was already rotated or revoked,
+    after revoking every token in its family.
+
+    A token presented again within a few seconds of its rotation is most
+    likely a second tab racing the first one, so it gets None instead of
+    revoking the family the first tab just received a token from.
+
+    Rotated tokens keep the expiry of the login that started the family,
+    so a session has an absolute lifetime however often it is refreshed.
+    """
+    db = await get_database()
+    token_hash = hash_refresh_token(token)
+    new_token, new_hash = _new_refresh_token()
+    now = datetime.utcnow()
+
+    # Atomically claim the token so concurrent refreshes cannot both succeed
+    session = await db.sessions.find_one_and_update(
+        {"token_hash": token_hash, "revoked": False, "expires_at": {"$gt": now}},
+        {"$set": {"revoked": True, "replaced_by": new_hash, "rotated_at": now}}
+    )
+    if not session:
+        stale = await db.sessions.find_one({"token_hash": token_hash})
+        if stale and stale["revoked"]:
+            grace = timedelta(seconds=settings.refresh_token_reuse_grace_seconds)
+            if stale.get("rotated_at") and now - stale["rotated_at"] < grace:
+                return None
+            await revoke_family(stale["family_id"])
+            raise RefreshTokenReuseError("Refresh token reuse detected")
+        return None
+
+    user = await get_user_by_username(session["username"])
+    if not user or not user.is_active:
+        await revoke_family(session["family_id"])
+        return None
+
+    await _store_session(new_hash, session["username"], session["family_id"], session["expires_at"])
+    return session["username"], new_token
+
+
+async def revoke_family(family_id: str) -> None:
+    """Revoke every refresh token issued in a session family"""
+    db = await get_database()
+    await db.sessions.update_many(
+        {"family_id": family_id},
+        {"$set": {"revoked": True}}
+    )
+
+
+async def revoke_session(token: str) -> bool:
+    """Revoke the session a refresh token belongs to"""
+    db = await get_database()
+    session = await db.sessions.find_one({"token_hash": hash_refresh_token(token)})
+    if not session:
+        return False
+
+    await revoke_family(session["family_id"])
+    return True
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import asyncio
+from typing import Dict, List, Optional, Tuple
 from bson import ObjectId
 from app.database import get_database
 from app.models.student import StudentCreate, StudentUpdate, StudentResponse
@@ -40,6 +41,86 @@ async def get_student_by_id(student_id: str) -> Optional[StudentResponse]:
     )
 
 
+async def get_students_by_ids(student_ids: List[str]) -> Dict[str, StudentResponse]:
+    """Get students for a list of IDs with a single query, keyed by ID"""
+    db = await get_database()
+    
+    object_ids = list({ObjectId(i) for i in student_ids if ObjectId.is_valid(i)})
+    if not object_ids:
+        return {}
+    
+    students = {}
+    async for student in db.students.find({"_id": {"$in": object_ids}}):
+        students[str(student["_id"])] = StudentResponse(
+            id=str(student["_id"]),
+            **{k: v for k, v in student.items() if k != "_id"}
+        )
+    
+    return students
+
+
+class StudentLoader:
+    """Batches and caches student lookups for the lifetime of one request.
+    
+    IDs requested through load() in the same event loop tick are fetched
+    together with one $in query, and each distinct ID is fetched only once.
+    """
+    
+    def __init__(self):
+        self._cache: Dict[str, "asyncio.Future[Optional[StudentResponse]]"] = {}
+        self._pending: List[Tuple[str, "asyncio.Future[Optional[StudentResponse]]"]] = []
+        self._dispatch_task: Optional[asyncio.Task] = None
+    
+    def load(self, student_id: str) -> "asyncio.Future[Optional[StudentResponse]]":
+        """Schedule a student lookup and return a future for its result"""
+        if student_id in self._cache:
+            return self._cache[student_id]
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[student_id] = future
+        
+        if not self._pending:
+            loop.call_soon(self._schedule_dispatch)
+        self._pending.append((student_id, future))
+        return future
+    
+    async def load_many(self, student_ids: List[str]) -> List[Optional[StudentResponse]]:
+        """Look up several students, returning results in request order"""
+        return list(await asyncio.gather(*(self.load(i) for i in student_ids)))
+    
+    def prime(self, student: StudentResponse) -> None:
+        """Store an already fetched student in the cache"""
+        future = self._cache.get(student.id)
+        if future is not None and not future.done():
+            # Resolve a pending load() now; its batch will leave it alone
+            future.set_result(student)
+            return
+        
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(student)
+        self._cache[student.id] = future
+    
+    def _schedule_dispatch(self):
+        self._dispatch_task = asyncio.ensure_future(self._dispatch())
+    
+    async def _dispatch(self):
+        batch, self._pending = self._pending, []
+        try:
+            students = await get_students_by_ids([student_id for student_id, _ in batch])
+        except Exception as e:
+            for student_id, future in batch:
+                if self._cache.get(student_id) is future:
+                    del self._cache[student_id]
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for student_id, future in batch:
+            if not future.done():
+                future.set_result(students.get(str(ObjectId(student_id))))
+
+
 async def get_all_students() -> List[StudentResponse]:
     """Get all students"""
     db = await get_database()
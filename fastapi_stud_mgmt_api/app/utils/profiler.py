@@ -0,0 +1,308 @@
+import asyncio
+import logging
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Set, Tuple
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+logger = logging.getLogger(__name__)
+
+# Route ("METHOD /path") of the request currently being served
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+
+# Operations whose first argument is a query filter
+FILTERED_OPERATIONS = (
+    "find_one",
+    "find_one_and_update",
+    "find_one_and_delete",
+    "update_one",
+    "update_many",
+    "delete_one",
+    "delete_many",
+    "count_documents",
+)
+UNFILTERED_OPERATIONS = ("insert_one", "insert_many")
+# Cursor methods that modify the cursor in place and return it
+CHAINING_CURSOR_METHODS = (
+    "limit",
+    "skip",
+    "batch_size",
+    "max_time_ms",
+    "hint",
+    "collation",
+    "comment",
+    "where",
+    "allow_disk_use",
+    "max",
+    "min",
+)
+
+
+def query_shape(query: Any) -> Any:
+    """Replace literal values in a query with placeholders, keeping its structure"""
+    if isinstance(query, dict):
+        return {key: query_shape(value) for key, value in sorted(query.items())}
+    if isinstance(query, (list, tuple)):
+        shapes = [query_shape(value) for value in query]
+        return shapes if any(isinstance(s, (dict, list)) for s in shapes) else "?"
+    return "?"
+
+
+def _plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Collect every stage name in an explain() plan tree"""
+    stages = [plan.get("stage", "")]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages.extend(_plan_stages(plan[key]))
+    for child in plan.get("inputStages", []):
+        stages.extend(_plan_stages(child))
+    return stages
+
+
+class ShapeStats:
+    """Aggregated timings and plan information for one query shape"""
+
+    def __init__(self, collection: str, operation: str, shape: str):
+        self.collection = collection
+        self.operation = operation
+        self.shape = shape
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow_count = 0
+        self.routes: Dict[str, int] = {}
+        self.explained = 0
+        self.collscans = 0
+        self.docs_examined = 0
+        self.docs_returned = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "collection": self.collection,
+            "operation": self.operation,
+            "shape": self.shape,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "slow_count": self.slow_count,
+            "routes": self.routes,
+            "explained": self.explained,
+            "collscans": self.collscans,
+            "docs_examined": self.docs_examined,
+            "docs_returned": self.docs_returned,
+            "examined_returned_ratio": (
+                round(self.docs_examined / self.docs_returned, 2) if self.docs_returned
+                else float(self.docs_examined)
+            ),
+        }
+
+
+class QueryProfiler:
+    """Records MongoDB operations by query shape and flags slow or unindexed ones"""
+
+    def __init__(self, slow_query_ms: float = 100.0, explain_sample_rate: float = 0.0):
+        self.slow_query_ms = slow_query_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.stats: Dict[Tuple[str, str, str], ShapeStats] = {}
+        self.explain_tasks: Set[asyncio.Task] = set()
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+    def record(
+        self, collection: str, operation: str, query: Any, elapsed_ms: float, sort=None
+    ) -> Tuple[ShapeStats, bool]:
+        """Record one operation; returns its stats and whether it is a new shape"""
+        shape = repr(query_shape(query))
+        if sort:
+            shape += f" sort {sort!r}"
+        key = (collection, operation, shape)
+        entry = self.stats.get(key)
+        is_new = entry is None
+        if is_new:
+            entry = self.stats[key] = ShapeStats(collection, operation, shape)
+
+        route = current_route.get() or "<no route>"
+        entry.count += 1
+        entry.total_ms += elapsed_ms
+        entry.max_ms = max(entry.max_ms, elapsed_ms)
+        entry.routes[route] = entry.routes.get(route, 0) + 1
+
+        if elapsed_ms >= self.slow_query_ms:
+            entry.slow_count += 1
+            logger.warning(
+                "Slow query (%.1f ms) on %s.%s %s from %s",
+                elapsed_ms, collection, operation, shape, route
+            )
+        return entry, is_new
+
+    def should_explain(self, is_new: bool) -> bool:
+        """Explain the first occurrence of a shape and a random sample of the rest"""
+        if self.explain_sample_rate <= 0:
+            return False
+        return is_new or random.random() < self.explain_sample_rate
+
+    def record_explain(self, entry: ShapeStats, explain: Dict[str, Any]) -> None:
+        """Fold an explain() result into a shape's stats"""
+        winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+        execution = explain.get("executionStats", {})
+
+        entry.explained += 1
+        if "COLLSCAN" in _plan_stages(winning_plan):
+            entry.collscans += 1
+            logger.warning(
+                "Collection scan on %s.%s %s", entry.collection, entry.operation, entry.shape
+            )
+        entry.docs_examined += execution.get("totalDocsExamined", 0)
+        entry.docs_returned += execution.get("nReturned", 0)
+
+    def top_shapes(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Return query shapes ordered by total time spent"""
+        ordered = sorted(self.stats.values(), key=lambda s: s.total_ms, reverse=True)
+        return [entry.to_dict() for entry in ordered[:limit]]
+
+
+class ProfiledCursor:
+    """Wraps a Motor cursor and times the fetches of its iteration"""
+
+    def __init__(self, cursor, collection: "ProfiledCollection", query: Any):
+        self._cursor = cursor
+        self._collection = collection
+        self._query = query
+        self._sort: Optional[List[Tuple[str, Any]]] = None
+        self._elapsed = 0.0
+        self._started = False
+        self._recorded = False
+
+    def __getattr__(self, name):
+        attr = getattr(self._cursor, name)
+        if name in CHAINING_CURSOR_METHODS:
+            def chain(*args, **kwargs):
+                # Keep the chain on this wrapper so iteration is still profiled
+                self._cursor = attr(*args, **kwargs)
+                return self
+            return chain
+        return attr
+
+    def sort(self, key_or_list, direction=None):
+        self._cursor = self._cursor.sort(key_or_list, direction)
+        if isinstance(key_or_list, str):
+            self._sort = [(key_or_list, 1 if direction is None else direction)]
+        else:
+            items = key_or_list.items() if isinstance(key_or_list, dict) else key_or_list
+            self._sort = [(key, value) for key, value in items]
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        # Only time the cursor itself, not the caller's work between documents
+        self._started = True
+        start = time.perf_counter()
+        try:
+            document = await self._cursor.__anext__()
+        except StopAsyncIteration:
+            self._elapsed += time.perf_counter() - start
+            self._finish()
+            raise
+        self._elapsed += time.perf_counter() - start
+        return document
+
+    async def to_list(self, length=None):
+        self._started = True
+        start = time.perf_counter()
+        result = await self._cursor.to_list(length)
+        self._elapsed += time.perf_counter() - start
+        self._finish()
+        return result
+
+    async def close(self):
+        self._finish()
+        await self._cursor.close()
+
+    def __del__(self):
+        # Loops that break early never see StopAsyncIteration
+        if "_recorded" in self.__dict__:
+            self._finish()
+
+    def _finish(self) -> None:
+        if self._recorded or not self._started:
+            return
+        self._recorded = True
+        self._collection._record("find", self._query, self._elapsed * 1000, sort=self._sort)
+
+
+class ProfiledCollection:
+    """Wraps a Motor collection and reports its operations to a QueryProfiler"""
+
+    def __init__(self, collection, profiler: QueryProfiler):
+        self._collection = collection
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name in FILTERED_OPERATIONS or name in UNFILTERED_OPERATIONS:
+            return self._wrap(name, attr)
+        return attr
+
+    def find(self, filter=None, *args, **kwargs):
+        cursor = self._collection.find(filter, *args, **kwargs)
+        return ProfiledCursor(cursor, self, filter or {})
+
+    def _wrap(self, name, method):
+        async def wrapper(*args, **kwargs):
+            if name in FILTERED_OPERATIONS:
+                query = args[0] if args else kwargs.get("filter", {})
+            else:
+                query = {}
+            start = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self._record(name, query, (time.perf_counter() - start) * 1000)
+        return wrapper
+
+    def _record(self, operation: str, query: Any, elapsed_ms: float, sort=None) -> None:
+        entry, is_new = self._profiler.record(self._collection.name, operation, query, elapsed_ms, sort)
+        if operation in UNFILTERED_OPERATIONS or not self._profiler.should_explain(is_new):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Cursor finalised outside the event loop; skip the sample
+            return
+        task = loop.create_task(self._explain(entry, query, sort))
+        # Keep a reference so the task is not garbage collected before it finishes
+        self._profiler.explain_tasks.add(task)
+        task.add_done_callback(self._profiler.explain_tasks.discard)
+
+    async def _explain(self, entry: ShapeStats, query: Any, sort=None) -> None:
+        try:
+            cursor = self._collection.find(query)
+            if sort:
+                cursor = cursor.sort(sort)
+            explain = await cursor.explain()
+        except Exception as e:
+            logger.debug("explain() failed for %s: %s", entry.shape, e)
+            return
+        self._profiler.record_explain(entry, explain)
+
+
+class ProfiledDatabase:
+    """Wraps a Motor database so that every collection it returns is profiled"""
+
+    def __init__(self, database, profiler: QueryProfiler):
+        self._database = database
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        attr = getattr(self._database, name)
+        if isinstance(attr, AsyncIOMotorCollection):
+            return ProfiledCollection(attr, self._profiler)
+        return attr
+
+    def __getitem__(self, name):
+        return ProfiledCollection(self._database[name], self._profiler)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Script to dump the top MongoDB query shapes recorded by the API's query profiler.
+The API must be running with QUERY_PROFILING=true.
+"""
+import argparse
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+
+api_url = os.getenv("API_URL", "http://localhost:8000")
+
+
+def request(method: str, path: str, body: dict = None, token: str = None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(f"{api_url}{path}", data=data, method=method)
+    req.add_header("Content-Type", "application/json")
+    if token:
+        req.add_header("Authorization", f"Bearer {token}")
+    with urllib.request.urlopen(req) as response:
+        content = response.read()
+        return json.loads(content) if content else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--username", default=os.getenv("API_USERNAME"), required=not os.getenv("API_USERNAME"))
+    parser.add_argument("--password", default=os.getenv("API_PASSWORD"), required=not os.getenv("API_PASSWORD"))
+    parser.add_argument("--limit", type=int, default=20, help="Number of query shapes to show")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON")
+    parser.add_argument("--reset", action="store_true", help="Clear statistics after dumping them")
+    args = parser.parse_args()
+
+    try:
+        login = request("POST", "/v1/auth/login", {"username": args.username, "password": args.password})
+        token = login["access_token"]
+        profile = request("GET", f"/v1/admin/query-profile?limit={args.limit}", token=token)
+        if args.reset:
+            request("DELETE", "/v1/admin/query-profile", token=token)
+    except urllib.error.HTTPError as e:
+        print(f"Error: {e.code} {e.read().decode()}", file=sys.stderr)
+        return 1
+    except urllib.error.URLError as e:
+        print(f"Error: could not reach {api_url}: {e.reason}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(profile, indent=2))
+        return 0
+
+    print(f"Slow query threshold: {profile['slow_query_ms']} ms, "
+          f"explain sample rate: {profile['explain_sample_rate']}")
+    print(f"{'total ms':>10} {'count':>7} {'avg ms':>8} {'max ms':>8} {'slow':>5} "
+          f"{'scans':>5} {'ex/ret':>7}  query")
+    for shape in profile["shapes"]:
+        flag = "COLLSCAN " if shape["collscans"] else ""
+        print(f"{shape['total_ms']:>10.1f} {shape['count']:>7} {shape['avg_ms']:>8.2f} "
+              f"{shape['max_ms']:>8.2f} {shape['slow_count']:>5} {shape['collscans']:>5} "
+              f"{shape['examined_returned_ratio']:>7}  "
+              f"{flag}{shape['collection']}.{shape['operation']} {shape['shape']}")
+        top_route = max(shape["routes"], key=shape["routes"].get)
+        print(f"{'':>57}  top route: {top_route}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+import asyncio
+import json
+from starlette.requests import Request
+from starlette.responses import Response
+from app.middleware.admission import AdaptiveLimiter, AdmissionControlMiddleware, classify_request
+
+
+def make_limiter(initial_limit=2, queue_deadline_ms=50, max_queue=4):
+    return AdaptiveLimiter(
+        "test", initial_limit=initial_limit, min_limit=1, max_limit=8,
+        target_latency_ms=100, queue_deadline_ms=queue_deadline_ms, max_queue=max_queue
+    )
+
+
+def make_request(method, path):
+    return Request({"type": "http", "method": method, "path": path, "headers": [], "query_string": b""})
+
+
+def test_fast_path_admits_up_to_limit():
+    async def run():
+        limiter = make_limiter(initial_limit=2)
+        assert await limiter.acquire()
+        assert await limiter.acquire()
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.in_flight == 2
+    assert limiter.rejected == 0
+
+
+def test_full_queue_is_shed_immediately():
+    async def run():
+        limiter = make_limiter(initial_limit=1, queue_deadline_ms=10_000, max_queue=0)
+        assert await limiter.acquire()
+        return await asyncio.wait_for(limiter.acquire(), 1), limiter
+
+    admitted, limiter = asyncio.run(run())
+    assert not admitted
+    assert limiter.rejected == 1
+
+
+def test_waiter_is_shed_at_deadline():
+    async def run():
+        limiter = make_limiter(initial_limit=1, queue_deadline_ms=20)
+        assert await limiter.acquire()
+        return await limiter.acquire(), limiter
+
+    admitted, limiter = asyncio.run(run())
+    assert not admitted
+    assert limiter.rejected == 1
+    assert limiter.in_flight == 1
+    assert not limiter._waiters
+
+
+def test_waiter_gets_slot_released_before_deadline():
+    async def run():
+        limiter = make_limiter(initial_limit=1, queue_deadline_ms=1000)
+        assert await limiter.acquire()
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        limiter.release(0.001)
+        return await waiting, limiter
+
+    admitted, limiter = asyncio.run(run())
+    assert admitted
+    assert limiter.in_flight == 1
+
+
+def test_slot_handed_over_at_deadline_is_kept(monkeypatch):
+    limiter = make_limiter(initial_limit=1)
+
+    async def handover_then_timeout(waiter):
+        # The slot is released in the same tick the deadline expires
+        limiter.release(0.001)
+        assert waiter.done()
+        raise asyncio.TimeoutError
+
+    async def run():
+        assert await limiter.acquire()
+        monkeypatch.setattr(limiter, "_wait_for_slot", handover_then_timeout)
+        return await limiter.acquire()
+
+    assert asyncio.run(run())
+    assert limiter.in_flight == 1
+    assert limiter.rejected == 0
+    assert not limiter._waiters
+
+
+def test_cancelled_waiter_returns_handed_over_slot():
+    async def run():
+        limiter = make_limiter(initial_limit=1, queue_deadline_ms=1000)
+        assert await limiter.acquire()
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        # The client goes away in the same tick its slot is handed over
+        waiting.cancel()
+        limiter.release(0.001)
+        await asyncio.gather(waiting, return_exceptions=True)
+        return waiting, limiter
+
+    waiting, limiter = asyncio.run(run())
+    assert waiting.cancelled()
+    assert limiter.in_flight == 0
+    assert not limiter._waiters
+
+
+def test_cancelled_queued_waiter_leaves_queue():
+    async def run():
+        limiter = make_limiter(initial_limit=1, queue_deadline_ms=1000)
+        assert await limiter.acquire()
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.in_flight == 1
+    assert not limiter._waiters
+
+
+def test_decrease_keeps_partial_slot():
+    limiter = make_limiter(initial_limit=4)
+    limiter.in_flight = 1
+    limiter.release(1.0)
+    assert limiter.limit < 4
+    assert limiter.allowed() == 4
+
+
+def test_classify_request_keeps_refresh_out_of_auth():
+    assert classify_request(make_request("POST", "/v1/auth/login")) == "auth"
+    assert classify_request(make_request("POST", "/v1/auth/register")) == "auth"
+    assert classify_request(make_request("POST", "/v1/auth/refresh")) == "session"
+    assert classify_request(make_request("POST", "/v1/auth/logout")) == "session"
+    assert classify_request(make_request("GET", "/v1/students/")) == "student_read"
+    assert classify_request(make_request("POST", "/v1/students/batch-get")) == "student_read"
+    assert classify_request(make_request("PUT", "/v1/students/abc")) == "student_write"
+    assert classify_request(make_request("GET", "/health")) is None
+
+
+def test_middleware_sheds_with_503_and_retry_after():
+    limiter = make_limiter(initial_limit=1, queue_deadline_ms=2500, max_queue=0)
+    middleware = AdmissionControlMiddleware(app=None, limiters={"student_read": limiter})
+
+    async def call_next(request):
+        return Response("ok")
+
+    async def run():
+        assert await limiter.acquire()
+        return await middleware.dispatch(make_request("GET", "/v1/students/"), call_next)
+
+    response = asyncio.run(run())
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    assert json.loads(response.body)["detail"]
+
+
+def test_middleware_releases_slot_after_request():
+    limiter = make_limiter(initial_limit=1)
+    middleware = AdmissionControlMiddleware(app=None, limiters={"student_read": limiter})
+
+    async def call_next(request):
+        assert limiter.in_flight == 1
+        return Response("ok")
+
+    response = asyncio.run(middleware.dispatch(make_request("GET", "/v1/students/"), call_next))
+    assert response.status_code == 200
+    assert limiter.in_flight == 0
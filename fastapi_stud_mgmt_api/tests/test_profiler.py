@@ -0,0 +1,188 @@
+import asyncio
+import gc
+import logging
+from app.utils.profiler import (
+    ProfiledCollection,
+    QueryProfiler,
+    _plan_stages,
+    current_route,
+    query_shape
+)
+
+COLLSCAN_EXPLAIN = {
+    "queryPlanner": {"winningPlan": {"stage": "COLLSCAN", "filter": {"email": {"$eq": "a@example.com"}}}},
+    "executionStats": {"nReturned": 1, "totalDocsExamined": 250},
+}
+IXSCAN_EXPLAIN = {
+    "queryPlanner": {"winningPlan": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": "email_1"}}},
+    "executionStats": {"nReturned": 1, "totalDocsExamined": 1},
+}
+
+
+class FakeCursor:
+    def __init__(self, collection, query, documents=()):
+        self.collection = collection
+        self.query = query
+        self.documents = list(documents)
+        self.sort_spec = None
+        self.limit_value = None
+
+    def sort(self, key_or_list, direction=None):
+        self.sort_spec = key_or_list
+        return self
+
+    def limit(self, value):
+        self.limit_value = value
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.documents:
+            raise StopAsyncIteration
+        return self.documents.pop(0)
+
+    async def close(self):
+        pass
+
+    async def explain(self):
+        self.collection.explained.append((self.query, self.sort_spec))
+        return self.collection.explain_result
+
+
+class FakeMotorCollection:
+    name = "students"
+
+    def __init__(self, documents=(), explain_result=COLLSCAN_EXPLAIN):
+        self.documents = list(documents)
+        self.explain_result = explain_result
+        self.explained = []
+        self.cursors = []
+
+    def find(self, query=None, *args, **kwargs):
+        cursor = FakeCursor(self, query, self.documents)
+        self.cursors.append(cursor)
+        return cursor
+
+    async def find_one(self, query):
+        return self.documents[0] if self.documents else None
+
+
+async def drain_explains(profiler):
+    await asyncio.gather(*profiler.explain_tasks)
+
+
+def test_query_shape_replaces_values_and_keeps_structure():
+    query = {"email": "a@example.com", "_id": {"$ne": 5}, "$or": [{"grade": 3}, {"age": {"$lt": 10}}]}
+    assert query_shape(query) == {
+        "$or": [{"grade": "?"}, {"age": {"$lt": "?"}}],
+        "_id": {"$ne": "?"},
+        "email": "?",
+    }
+    assert query_shape({"_id": {"$in": [1, 2, 3]}}) == {"_id": {"$in": "?"}}
+    assert query_shape({"b": 1, "a": 2}) == query_shape({"a": 3, "b": 4})
+
+
+def test_plan_stages_walks_nested_plans():
+    plan = {"stage": "OR", "inputStages": [IXSCAN_EXPLAIN["queryPlanner"]["winningPlan"], {"stage": "COLLSCAN"}]}
+    assert _plan_stages(plan) == ["OR", "FETCH", "IXSCAN", "COLLSCAN"]
+
+
+def test_record_explain_flags_collscan_and_ratio(caplog):
+    profiler = QueryProfiler()
+    entry, _ = profiler.record("students", "find_one", {"email": "a@example.com"}, 1.0)
+
+    with caplog.at_level(logging.WARNING, logger="app.utils.profiler"):
+        profiler.record_explain(entry, COLLSCAN_EXPLAIN)
+
+    stats = entry.to_dict()
+    assert stats["collscans"] == 1
+    assert stats["docs_examined"] == 250
+    assert stats["examined_returned_ratio"] == 250.0
+    assert "Collection scan on students.find_one" in caplog.text
+
+
+def test_record_explain_accepts_index_scan():
+    profiler = QueryProfiler()
+    entry, _ = profiler.record("users", "find_one", {"username": "alice"}, 1.0)
+    profiler.record_explain(entry, IXSCAN_EXPLAIN)
+
+    stats = entry.to_dict()
+    assert stats["collscans"] == 0
+    assert stats["examined_returned_ratio"] == 1.0
+
+
+def test_slow_query_is_logged_with_route(caplog):
+    profiler = QueryProfiler(slow_query_ms=50)
+    token = current_route.set("GET /v1/students/{student_id}")
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.utils.profiler"):
+            profiler.record("students", "find_one", {"_id": 1}, 10.0)
+            entry, _ = profiler.record("students", "find_one", {"_id": 2}, 75.0)
+    finally:
+        current_route.reset(token)
+
+    assert entry.count == 2
+    assert entry.slow_count == 1
+    assert "Slow query (75.0 ms) on students.find_one" in caplog.text
+    assert "GET /v1/students/{student_id}" in caplog.text
+
+
+def test_collection_operations_are_tagged_with_route_and_explained():
+    profiler = QueryProfiler(explain_sample_rate=1.0)
+    collection = ProfiledCollection(FakeMotorCollection([{"_id": 1}]), profiler)
+
+    async def run():
+        token = current_route.set("POST /v1/students/")
+        try:
+            await collection.find_one({"email": "a@example.com"})
+            await collection.find_one({"email": "b@example.com"})
+        finally:
+            current_route.reset(token)
+        await collection.find_one({"email": "c@example.com"})
+        await drain_explains(profiler)
+
+    asyncio.run(run())
+    [shape] = profiler.top_shapes()
+    assert shape["count"] == 3
+    assert shape["routes"] == {"POST /v1/students/": 2, "<no route>": 1}
+    assert shape["collscans"] == shape["explained"] == 3
+    assert not profiler.explain_tasks
+
+
+def test_chained_cursor_is_profiled_with_sort_in_shape():
+    profiler = QueryProfiler(explain_sample_rate=1.0)
+    motor_collection = FakeMotorCollection([{"_id": 1}, {"_id": 2}])
+    collection = ProfiledCollection(motor_collection, profiler)
+
+    async def run():
+        cursor = collection.find({"grade": 5}).sort("name", -1).limit(10)
+        assert cursor.limit_value == 10
+        documents = [document async for document in cursor]
+        await drain_explains(profiler)
+        return documents
+
+    assert len(asyncio.run(run())) == 2
+    [shape] = profiler.top_shapes()
+    assert shape["operation"] == "find"
+    assert "sort [('name', -1)]" in shape["shape"]
+    assert motor_collection.explained == [({"grade": 5}, [("name", -1)])]
+
+
+def test_cursor_closed_early_is_recorded():
+    profiler = QueryProfiler()
+    collection = ProfiledCollection(FakeMotorCollection([{"_id": 1}, {"_id": 2}]), profiler)
+
+    async def run():
+        async for _ in collection.find({"grade": 5}):
+            break
+        gc.collect()
+
+        cursor = collection.find({"age": 10})
+        await cursor.__anext__()
+        await cursor.close()
+
+    asyncio.run(run())
+    assert sorted(shape["shape"] for shape in profiler.top_shapes()) == ["{'age': '?'}", "{'grade': '?'}"]
+    assert all(shape["count"] == 1 for shape in profiler.top_shapes())
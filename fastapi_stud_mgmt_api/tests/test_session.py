@@ -0,0 +1,169 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+import app.services.session as session_service
+from app.models.auth import User
+from app.services.session import (
+    RefreshTokenReuseError,
+    create_session,
+    hash_refresh_token,
+    revoke_session,
+    rotate_refresh_token
+)
+
+
+def matches(document, query):
+    for key, condition in query.items():
+        value = document.get(key)
+        if isinstance(condition, dict) and "$gt" in condition:
+            if value is None or not value > condition["$gt"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeSessions:
+    def __init__(self):
+        self.documents = []
+
+    async def insert_one(self, document):
+        self.documents.append(dict(document))
+
+    async def find_one(self, query):
+        return next((dict(d) for d in self.documents if matches(d, query)), None)
+
+    async def find_one_and_update(self, query, update):
+        for document in self.documents:
+            if matches(document, query):
+                before = dict(document)
+                document.update(update["$set"])
+                return before
+        return None
+
+    async def update_many(self, query, update):
+        for document in self.documents:
+            if matches(document, query):
+                document.update(update["$set"])
+
+    def by_token(self, token):
+        return next(d for d in self.documents if d["token_hash"] == hash_refresh_token(token))
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.sessions = FakeSessions()
+
+
+@pytest.fixture
+def database(monkeypatch):
+    database = FakeDatabase()
+    users = {"alice": User(id="1", username="alice", email="alice@example.com")}
+
+    async def get_database():
+        return database
+
+    async def get_user_by_username(username):
+        return users.get(username)
+
+    monkeypatch.setattr(session_service, "get_database", get_database)
+    monkeypatch.setattr(session_service, "get_user_by_username", get_user_by_username)
+    database.users = users
+    return database
+
+
+def test_token_rotates_exactly_once(database):
+    async def run():
+        token = await create_session("alice")
+        first = await rotate_refresh_token(token)
+        # Inside the grace window a replay is refused without revoking anything
+        second = await rotate_refresh_token(token)
+        return token, first, second
+
+    token, first, second = asyncio.run(run())
+    assert first is not None and first[0] == "alice"
+    assert first[1] != token
+    assert second is None
+    assert not database.sessions.by_token(first[1])["revoked"]
+
+
+def test_replay_after_grace_revokes_family(database, monkeypatch):
+    monkeypatch.setattr(session_service.settings, "refresh_token_reuse_grace_seconds", 0)
+
+    async def run():
+        token = await create_session("alice")
+        _, new_token = await rotate_refresh_token(token)
+        with pytest.raises(RefreshTokenReuseError):
+            await rotate_refresh_token(token)
+        return new_token
+
+    new_token = asyncio.run(run())
+    assert all(d["revoked"] for d in database.sessions.documents)
+    assert database.sessions.by_token(new_token)["revoked"]
+
+
+def test_other_families_survive_reuse_revocation(database, monkeypatch):
+    monkeypatch.setattr(session_service.settings, "refresh_token_reuse_grace_seconds", 0)
+
+    async def run():
+        token = await create_session("alice")
+        other = await create_session("alice")
+        await rotate_refresh_token(token)
+        with pytest.raises(RefreshTokenReuseError):
+            await rotate_refresh_token(token)
+        return other
+
+    other = asyncio.run(run())
+    assert not database.sessions.by_token(other)["revoked"]
+
+
+def test_unknown_token_returns_none(database):
+    assert asyncio.run(rotate_refresh_token("not-a-token")) is None
+
+
+def test_expired_token_returns_none(database):
+    async def run():
+        token = await create_session("alice")
+        database.sessions.by_token(token)["expires_at"] = datetime.utcnow() - timedelta(seconds=1)
+        return await rotate_refresh_token(token)
+
+    assert asyncio.run(run()) is None
+
+
+@pytest.mark.parametrize("user", [None, User(id="1", username="alice", email="alice@example.com", is_active=False)])
+def test_missing_or_inactive_user_revokes_family(database, user):
+    async def run():
+        token = await create_session("alice")
+        if user is None:
+            del database.users["alice"]
+        else:
+            database.users["alice"] = user
+        return await rotate_refresh_token(token)
+
+    assert asyncio.run(run()) is None
+    assert database.sessions.documents
+    assert all(d["revoked"] for d in database.sessions.documents)
+
+
+def test_rotated_token_keeps_original_expiry(database):
+    async def run():
+        token = await create_session("alice")
+        _, second = await rotate_refresh_token(token)
+        _, third = await rotate_refresh_token(second)
+        return token, third
+
+    token, third = asyncio.run(run())
+    original = database.sessions.by_token(token)["expires_at"]
+    assert database.sessions.by_token(third)["expires_at"] == original
+
+
+def test_revoke_session_revokes_family(database):
+    async def run():
+        token = await create_session("alice")
+        _, new_token = await rotate_refresh_token(token)
+        assert await revoke_session(new_token)
+        with pytest.raises(RefreshTokenReuseError):
+            await rotate_refresh_token(new_token)
+
+    asyncio.run(run())
+    assert all(d["revoked"] for d in database.sessions.documents)
@@ -0,0 +1,134 @@
+import asyncio
+from bson import ObjectId
+import app.services.student as student_service
+from app.models.auth import User
+from app.models.student import StudentBatchGetRequest, StudentResponse
+from app.routes.student import batch_get_students
+from app.services.student import StudentLoader
+
+
+def make_student(student_id):
+    return {
+        "_id": ObjectId(student_id),
+        "name": f"Student {student_id[-4:]}",
+        "email": f"{student_id}@example.com",
+        "grade": 5,
+        "age": 10,
+        "address": "1 Main St",
+        "description": None,
+    }
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self._documents = iter(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeStudents:
+    def __init__(self, documents):
+        self.documents = {doc["_id"]: doc for doc in documents}
+        self.queries = []
+
+    def find(self, query):
+        self.queries.append(query)
+        wanted = query["_id"]["$in"]
+        return FakeCursor([self.documents[i] for i in wanted if i in self.documents])
+
+
+class FakeDatabase:
+    def __init__(self, documents):
+        self.students = FakeStudents(documents)
+
+
+def use_database(monkeypatch, documents):
+    database = FakeDatabase(documents)
+
+    async def get_database():
+        return database
+
+    monkeypatch.setattr(student_service, "get_database", get_database)
+    return database
+
+
+ID_A = str(ObjectId())
+ID_B = str(ObjectId())
+ID_MISSING = str(ObjectId())
+
+
+def test_load_many_returns_request_order_with_one_query(monkeypatch):
+    database = use_database(monkeypatch, [make_student(ID_A), make_student(ID_B)])
+
+    async def run():
+        return await StudentLoader().load_many([ID_B, ID_MISSING, ID_A])
+
+    results = asyncio.run(run())
+    assert [r.id if r else None for r in results] == [ID_B, None, ID_A]
+    assert len(database.students.queries) == 1
+
+
+def test_loads_in_same_tick_share_one_deduplicated_query(monkeypatch):
+    database = use_database(monkeypatch, [make_student(ID_A), make_student(ID_B)])
+
+    async def run():
+        loader = StudentLoader()
+        return await asyncio.gather(loader.load(ID_A), loader.load(ID_B), loader.load(ID_A))
+
+    results = asyncio.run(run())
+    assert [r.id for r in results] == [ID_A, ID_B, ID_A]
+    assert len(database.students.queries) == 1
+    assert len(database.students.queries[0]["_id"]["$in"]) == 2
+
+
+def test_cached_ids_are_not_fetched_again(monkeypatch):
+    database = use_database(monkeypatch, [make_student(ID_A)])
+
+    async def run():
+        loader = StudentLoader()
+        await loader.load(ID_A)
+        return await loader.load(ID_A)
+
+    assert asyncio.run(run()).id == ID_A
+    assert len(database.students.queries) == 1
+
+
+def test_prime_resolves_pending_load(monkeypatch):
+    use_database(monkeypatch, [make_student(ID_A)])
+    primed = StudentResponse(id=ID_A, **{k: v for k, v in make_student(ID_A).items() if k != "_id"})
+
+    async def run():
+        loader = StudentLoader()
+        future = loader.load(ID_A)
+        loader.prime(primed)
+        result = await asyncio.wait_for(future, 1)
+        await loader._dispatch_task
+        return result
+
+    assert asyncio.run(run()) is primed
+
+
+def test_batch_get_marks_invalid_and_not_found_ids(monkeypatch):
+    database = use_database(monkeypatch, [make_student(ID_A)])
+    user = User(id="1", username="admin", email="admin@example.com")
+    request = StudentBatchGetRequest(ids=["not-an-id", ID_A, ID_MISSING, ID_A])
+
+    async def run():
+        return await batch_get_students(request, current_user=user, loader=StudentLoader())
+
+    response = asyncio.run(run())
+    assert [(item.id, item.status) for item in response.results] == [
+        ("not-an-id", "invalid_id"),
+        (ID_A, "found"),
+        (ID_MISSING, "not_found"),
+        (ID_A, "found"),
+    ]
+    assert response.results[1].student.id == ID_A
+    assert len(database.students.queries) == 1
@@ -4,6 +4,7 @@ import StudentForm from './components/StudentForm'
 import Login from './components/Login'
 import Register from './components/Register'
 import ProtectedRoute from './components/ProtectedRoute'
+import api from './utils/api'
 import './App.css'
 
 function App() {
@@ -34,9 +35,15 @@ function App() {
                 </div>
                 <div className="flex items-center">
                   <button
-                    onClick={() => {
+                    onClick={async () => {
+                      // Revoke the refresh token session on the server
+                      const refreshToken = localStorage.getItem('refresh_token');
+                      if (refreshToken) {
+                        await api.post('/v1/auth/logout', { refresh_token: refreshToken }).catch(() => undefined);
+                      }
                       // Clear authentication data
                       localStorage.removeItem('token');
+                      localStorage.removeItem('refresh_token');
                       // Redirect to login
                       window.location.href = '/login';
                     }}
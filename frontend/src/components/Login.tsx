@@ -30,8 +30,9 @@ export default function Login() {
       });
     
       console.log('Login successful, response:', response.data);
-      // Store the token in localStorage
+      // Store the tokens in localStorage
       localStorage.setItem('token', response.data.access_token);
+      localStorage.setItem('refresh_token', response.data.refresh_token);
       
       // Redirect to the students page
       navigate('/v1/students/');
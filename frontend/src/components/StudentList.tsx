@@ -55,14 +55,8 @@ export default function StudentList() {
       } catch (err: any) {
         console.error('API request failed:', err);
         
-        // Check if it's an authentication error
-        if (err.response && (err.response.status === 401 || err.response.status === 403)) {
-          // If unauthorized, clear token and redirect to login
-          localStorage.removeItem('token');
-          window.location.href = '/login';
-          return;
-        }
-        
+        // Expired sessions are sent to the login page by the API client; a 401 that
+        // reaches here means the token could not be refreshed right now
         setError('Failed to fetch students. Please make sure the API is running and accessible.');
         setStudents([]); // Ensure students is always an array
         setLoading(false);
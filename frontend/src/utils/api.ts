@@ -1,4 +1,4 @@
-import axios from 'axios';
+import axios, { AxiosError, InternalAxiosRequestConfig } from 'axios';
 
 // Create an instance of axios with default configurations
 const api = axios.create({
@@ -33,12 +33,81 @@ api.interceptors.request.use(
   }
 );
 
+// Clear stored tokens and send the user back to the login page
+const redirectToLogin = () => {
+  localStorage.removeItem('token');
+  localStorage.removeItem('refresh_token');
+  window.location.href = '/login';
+};
+
+// Renew the access token that `staleToken` belongs to. Refresh tokens can only be used
+// once and are shared by every tab through localStorage, so refreshes are serialised
+// across tabs with a Web Lock, and a token another tab already renewed is reused
+const doRefresh = async (staleToken: string | null): Promise<string> => {
+  const currentToken = localStorage.getItem('token');
+  if (currentToken && currentToken !== staleToken) {
+    return currentToken;
+  }
+
+  const refreshToken = localStorage.getItem('refresh_token');
+  if (!refreshToken) {
+    throw new Error('No refresh token');
+  }
+
+  const response = await axios.post(`${api.defaults.baseURL}/v1/auth/refresh`, { refresh_token: refreshToken });
+  localStorage.setItem('token', response.data.access_token);
+  localStorage.setItem('refresh_token', response.data.refresh_token);
+  return response.data.access_token as string;
+};
+
+// A single refresh shared by every request in this tab that fails while it is in flight
+let refreshPromise: Promise<string> | null = null;
+
+const refreshAccessToken = (staleToken: string | null): Promise<string> => {
+  if (!refreshPromise) {
+    refreshPromise = (navigator.locks
+      ? navigator.locks.request('token-refresh', () => doRefresh(staleToken))
+      : doRefresh(staleToken)
+    ).finally(() => {
+      refreshPromise = null;
+    });
+  }
+  return refreshPromise;
+};
+
 // Add a response interceptor to handle common error scenarios
 api.interceptors.response.use(
   (response) => {
     return response;
   },
-  (error) => {
+  async (error: AxiosError) => {
+    const originalRequest = error.config as (InternalAxiosRequestConfig & { _retried?: boolean }) | undefined;
+
+    // An expired access token is renewed with the refresh token instead of a new login
+    if (
+      error.response?.status === 401 &&
+      originalRequest &&
+      !originalRequest._retried &&
+      !originalRequest.url?.startsWith('/v1/auth/')
+    ) {
+      originalRequest._retried = true;
+      const staleToken = String(originalRequest.headers.Authorization ?? '').replace(/^Bearer /, '') || null;
+      try {
+        const token = await refreshAccessToken(staleToken);
+        originalRequest.headers.Authorization = `Bearer ${token}`;
+        return api(originalRequest);
+      } catch (refreshError) {
+        // Only a rejected refresh token ends the session. Shed (503), network and
+        // timeout errors keep the stored tokens so the next request can try again
+        const sessionEnded = !localStorage.getItem('refresh_token') ||
+          (axios.isAxiosError(refreshError) && refreshError.response?.status === 401);
+        if (sessionEnded) {
+          redirectToLogin();
+        }
+        return Promise.reject(error);
+      }
+    }
+
     // Log the error for debugging
     console.log('API Error:', error);
     
@@ -57,8 +126,7 @@ api.interceptors.response.use(
     
     // Handle authentication errors (401/403) by redirecting to login
     if (error.response && (error.response.status === 401 || error.response.status === 403)) {
-      localStorage.removeItem('token');
-      window.location.href = '/login';
+      redirectToLogin();
     }
     
     // Add better error handling for network errors